@@ -1,7 +1,12 @@
 # election/data_collector.py
 import csv, os
-from tqdm import trange  # progress bar (pip install tqdm)
+from functools import partial
+import multiprocessing
+
+import numpy as np
+from tqdm import tqdm  # progress bar (pip install tqdm)
 from election.generate import generate_election
+from election.profile import Profile
 from election.system import (
     plurality_winner,
     borda_winner,
@@ -15,6 +20,41 @@ from election.fairness import (
     monotonicity_violation_rate,
 )
 
+SYSTEMS = {
+    "Plurality": plurality_winner,
+    "Borda": borda_winner,
+    "IRV": irv_winner,
+    "RankedPairs": ranked_pairs_winner,
+}
+
+FIELDNAMES = [
+    "trial",
+    "system",
+    "satisfaction",
+    "condorcet_compliance",
+    "monotonicity_violation_rate",
+]
+
+# ---------------------------------------------------
+# One independent trial (runs inside a worker process)
+# ---------------------------------------------------
+def _one_trial(i, num_voters, num_candidates, entropy):
+    """Generate election `i` and return one row per voting system."""
+    # Seeded from (run entropy, trial index) so results don't depend on scheduling
+    rng = np.random.default_rng([entropy, i])
+    profile = Profile.from_ballots(generate_election(num_voters, num_candidates, rng))
+    rows = []
+    for name, func in SYSTEMS.items():
+        winner = func(profile)
+        rows.append((  # same order as FIELDNAMES
+            i + 1,
+            name,
+            satisfaction_score(winner, profile),
+            condorcet_compliance(winner, profile),
+            monotonicity_violation_rate(func, profile, trials=10, rng=rng, winner=winner),
+        ))
+    return rows
+
 # ---------------------------------------------------
 # Run repeated random elections and record statistics
 # ---------------------------------------------------
@@ -23,41 +63,28 @@ def run_experiments(
     num_trials=500,
     num_voters=200,
     num_candidates=4,
+    seed=None,
+    processes=None,
 ):
-    systems = {
-        "Plurality": plurality_winner,
-        "Borda": borda_winner,
-        "IRV": irv_winner,
-        "RankedPairs": ranked_pairs_winner,
-    }
-
-    fieldnames = [
-        "trial",
-        "system",
-        "satisfaction",
-        "condorcet_compliance",
-        "monotonicity_violation_rate",
-    ]
+    entropy = np.random.SeedSequence(seed).entropy
+    trial = partial(
+        _one_trial,
+        num_voters=num_voters,
+        num_candidates=num_candidates,
+        entropy=entropy,
+    )
 
     os.makedirs("data", exist_ok=True)
     path = os.path.join("data", outfile)
-    with open(path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    with open(path, "w", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
 
-        for i in trange(num_trials, desc="Running simulations"):
-            ballots = generate_election(num_voters, num_candidates)
-            for name, func in systems.items():
-                row = {
-                    "trial": i + 1,
-                    "system": name,
-                    "satisfaction": satisfaction_score(func, ballots),
-                    "condorcet_compliance": condorcet_compliance(func, ballots),
-                    "monotonicity_violation_rate": monotonicity_violation_rate(
-                        func, ballots, trials=10
-                    ),
-                }
-                writer.writerow(row)
+        # spawn, not fork: forked workers can hang once Numba's threading layer is loaded
+        with multiprocessing.get_context("spawn").Pool(processes) as pool:
+            results = pool.imap_unordered(trial, range(num_trials), chunksize=16)
+            for rows in tqdm(results, total=num_trials, desc="Running simulations"):
+                writer.writerows(rows)
 
     print(f"\n✅ Data saved to {path}")
     return path
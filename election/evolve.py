@@ -10,64 +10,69 @@ import csv
 import os
 from statistics import mean
 from copy import deepcopy
+from functools import partial
 
 import numpy as np
+from joblib import Parallel, delayed  # parallel fitness evaluation (pip install joblib)
 
-from election.generate import generate_election
-from election.fairness import (
-    satisfaction_score,
-    condorcet_compliance,
-    find_condorcet_winner,
-    monotonicity_violation_rate,
-)
+from election.generate import generate_elections
+from election.profile import Profile
+from election.utils import positional_scores, rank_weights
+from election.fairness import satisfaction_score, monotonicity_violation_rate
 # We'll use a local apply_rule, not the system module, because evolved rules are custom.
 
 # -------------------------
 # Rule application
 # -------------------------
-def apply_rule(ballots, weights):
-    """Apply a positional scoring rule defined by `weights` to ballots; return winner."""
+def apply_rule(profile, weights):
+    """Apply a positional scoring rule defined by `weights` to a profile; return winner."""
     # weights: list length = num_candidates, index=rank (0=first)
-    if not ballots:
+    # if weights shorter, missing ranks score 0
+    if profile.n == 0:
         return None
-    scores = {c: 0 for c in ballots[0]}
-    for ballot in ballots:
-        for rank, cand in enumerate(ballot):
-            # if weights shorter, treat missing as 0
-            val = weights[rank] if rank < len(weights) else 0
-            scores[cand] += val
-    return max(scores, key=scores.get)
+    return int(positional_scores(profile.B, weights).argmax())
 
 # -------------------------
 # Fitness evaluation
 # -------------------------
-def evaluate_rule(weights, num_trials=30, num_voters=100, num_candidates=4):
+def build_batch(num_trials=30, num_voters=100, num_candidates=4, rng=None):
     """
+    Generate the elections shared by every rule in a generation,
+    as one Profile whose arrays have a leading trial axis.
+    """
+    return Profile.from_ballots(generate_elections(num_trials, num_voters, num_candidates, rng))
+
+def evaluate_rule(weights, batch, rng=None):
+    """
+    Score a rule against a batch from build_batch.
     Returns a tuple: (fitness_scalar, avg_sat, condorcet_rate, avg_mono).
     """
-    sats = []
-    cond_hits = 0
-    cond_exists = 0
-    monos = []
-
-    for _ in range(num_trials):
-        ballots = generate_election(num_voters, num_candidates)
-        # satisfaction for this rule
-        sat = satisfaction_score(lambda b: apply_rule(b, weights), ballots)
-        sats.append(sat)
-        # condorcet
-        cw = find_condorcet_winner(ballots)
-        if cw is not None:
-            cond_exists += 1
-            if condorcet_compliance(lambda b: apply_rule(b, weights), ballots):
-                cond_hits += 1
-        # monotonicity
-        mono = monotonicity_violation_rate(lambda b: apply_rule(b, weights), ballots, trials=10)
-        monos.append(mono)
-
-    avg_sat = mean(sats) if sats else 0.0
+    num_trials, num_candidates = len(batch.B), batch.m
+    if num_trials == 0:
+        return 0.0, 0.0, 0.0, 0.0
+    w = rank_weights(weights, num_candidates)
+
+    # winners for every trial at once: candidate c scores sum_v w[R[t, v, c]]
+    winners = w[batch.R].sum(axis=1).argmax(axis=1)
+
+    # satisfaction for every trial's winner
+    sats = satisfaction_score(winners, batch)
+
+    # condorcet: the batch caches each trial's Condorcet winner (-1 if none)
+    cond_exists = int((batch.condorcet >= 0).sum())
+    cond_hits = int((batch.condorcet == winners).sum())
+
+    # monotonicity
+    rule = partial(apply_rule, weights=w)
+    # own copy per trial: the test swaps cells in place and the batch is shared by every rule
+    monos = [
+        monotonicity_violation_rate(rule, batch[t].copy(), trials=10, rng=rng, winner=winner)
+        for t, winner in enumerate(winners.tolist())
+    ]
+
+    avg_sat = float(sats.mean())
     cond_rate = (cond_hits / cond_exists) if cond_exists > 0 else 0.0
-    avg_mono = mean(monos) if monos else 0.0
+    avg_mono = mean(monos)
 
     # Weighted objective: tune these coefficients as you like
     fitness = 0.6 * avg_sat + 0.3 * cond_rate - 0.1 * avg_mono
@@ -113,10 +118,12 @@ def evolve_rules(
     elitism_frac=0.3,
     log_csv="data/evolve_log.csv",
     seed=None,
+    n_jobs=-1,
 ):
     if seed is not None:
         random.seed(seed)
-        np.random.seed(seed)
+    # Every evaluation draws from its own child seed, so parallel runs stay reproducible
+    seeds = np.random.SeedSequence(seed)
 
     os.makedirs("data", exist_ok=True)
 
@@ -131,11 +138,17 @@ def evolve_rules(
     best_overall = None
     best_overall_score = -1e9
 
+    parallel = Parallel(n_jobs=n_jobs, backend="loky")
     for gen in range(1, generations + 1):
         print(f"\n=== Starting Generation {gen}/{generations} ===")
+        batch_seed, *rule_seeds = seeds.spawn(1 + len(population))
+        batch = build_batch(num_trials, num_voters, num_candidates, rng=np.random.default_rng(batch_seed))
+        results = parallel(
+            delayed(evaluate_rule)(rule, batch, rng=np.random.default_rng(rule_seed))
+            for rule, rule_seed in zip(population, rule_seeds)
+        )
         scored = []
-        for rule in population:
-            fitness, avg_sat, cond_rate, avg_mono = evaluate_rule(rule, num_trials=num_trials, num_voters=num_voters, num_candidates=num_candidates)
+        for rule, (fitness, avg_sat, cond_rate, avg_mono) in zip(population, results):
             scored.append((rule, fitness, avg_sat, cond_rate, avg_mono))
             print(f"  → Evaluated rule {rule} → fitness {fitness:.3f}")
 
@@ -173,7 +186,9 @@ def evolve_rules(
         population = new_pop
 
     # Final evaluation of best overall
-    final_fitness, final_sat, final_cond, final_mono = evaluate_rule(best_overall, num_trials=100, num_voters=num_voters, num_candidates=num_candidates)
+    batch_seed, rule_seed = seeds.spawn(2)
+    final_batch = build_batch(100, num_voters, num_candidates, rng=np.random.default_rng(batch_seed))
+    final_fitness, final_sat, final_cond, final_mono = evaluate_rule(best_overall, final_batch, rng=np.random.default_rng(rule_seed))
     print("\n=== FINAL BEST RULE ===")
     print("Weights (rank1→...):", best_overall)
     print(f"Fitness: {final_fitness:.4f}, sat: {final_sat:.4f}, cond_rate: {final_cond:.4f}, mono: {final_mono:.4f}")
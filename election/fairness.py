@@ -1,118 +1,91 @@
 # election/fairness.py
-from collections import defaultdict
-from copy import deepcopy
-import random
+import numpy as np
 
 # -------------------------------
-# Pairwise comparisons
+# Condorcet Winner
 # -------------------------------
-def pairwise_matrix(ballots):
+def condorcet_winners(pairwise):
     """
-    Build a matrix (dict) of head-to-head wins: (a,b) -> # voters preferring a over b
+    Return the Condorcet winner of an (m, m) pairwise matrix, or -1 if none exists.
+    A (T, m, m) stack gives one id per trial.
     """
-    if not ballots:
-        return {}
-    candidates = ballots[0]
-    matrix = {}
-    for a in candidates:
-        for b in candidates:
-            if a == b:
-                continue
-            matrix[(a, b)] = 0
-    for ballot in ballots:
-        for i, a in enumerate(ballot):
-            for b in ballot[i + 1:]:
-                matrix[(a, b)] += 1
-    return matrix
+    num_candidates = pairwise.shape[-1]
+    beats_all = (pairwise > np.swapaxes(pairwise, -1, -2)).sum(axis=-1) == num_candidates - 1
+    winners = np.where(beats_all.any(axis=-1), beats_all.argmax(axis=-1), -1)
+    return int(winners) if winners.ndim == 0 else winners
 
-# -------------------------------
-# Condorcet Winner
-# -------------------------------
-def find_condorcet_winner(ballots):
+def find_condorcet_winner(profile):
     """
     Return the candidate that beats every other candidate head-to-head, if one exists.
     Otherwise return None.
     """
-    matrix = pairwise_matrix(ballots)
-    if not matrix:
-        return None
-    candidates = sorted(list({c for pair in matrix.keys() for c in pair}))
-    for c in candidates:
-        beats_all = True
-        for other in candidates:
-            if c == other:
-                continue
-            if matrix.get((c, other), 0) <= matrix.get((other, c), 0):
-                beats_all = False
-                break
-        if beats_all:
-            return c
-    return None
+    cw = profile.condorcet
+    return None if cw < 0 else cw
 
 # -------------------------------
 # Satisfaction Score
 # -------------------------------
-def satisfaction_score(system_func, ballots):
+def satisfaction_score(winner, profile):
     """
     Returns average satisfaction of voters with the winner.
     Winner ranked higher = higher satisfaction.
     Normalized between 0 (worst) and 1 (best).
+    A batched profile with one winner per trial gives one score per trial.
     """
-    if not ballots:
+    num_voters, num_candidates = profile.n, profile.m
+    if winner is None or num_voters == 0:
         return 0.0
-    winner = system_func(ballots)
-    if winner is None:
-        return 0.0
-    n = len(ballots[0])
-    total = 0
-    for b in ballots:
-        rank = b.index(winner)
-        total += (n - 1 - rank) / (n - 1)
-    return total / len(ballots)
+    winner_ranks = np.take_along_axis(profile.R, np.asarray(winner)[..., None, None], axis=-1)
+    return ((num_candidates - 1) - winner_ranks).sum(axis=(-2, -1)) / (num_voters * (num_candidates - 1))
 
 # -------------------------------
 # Condorcet Compliance
 # -------------------------------
-def condorcet_compliance(system_func, ballots):
+def condorcet_compliance(winner, profile):
     """
-    Returns True if system selects the Condorcet winner (when one exists).
+    Returns True if the system's winner is the Condorcet winner (when one exists).
     """
-    cw = find_condorcet_winner(ballots)
+    cw = find_condorcet_winner(profile)
     if cw is None:
         return None  # no Condorcet winner in this election
-    winner = system_func(ballots)
     return cw == winner
 
 # -------------------------------
 # Monotonicity Test
 # -------------------------------
-def monotonicity_violation_rate(system_func, ballots, trials=30):
+def monotonicity_violation_rate(system_func, profile, trials=30, rng=None, winner=None):
     """
     Approximate monotonicity test:
     - Pick random voter who doesn't rank winner 1st
     - Move winner up one rank
     - If the promoted candidate loses, count as violation
     Returns fraction of trials with violation.
+    Pass `winner` when the system's winner on this profile is already known.
+    The profile is modified in place during each trial and restored afterwards.
     """
-    if not ballots:
+    if profile.n == 0:
         return 0.0
-    original_winner = system_func(ballots)
+    original_winner = system_func(profile) if winner is None else winner
     if original_winner is None:
         return 0.0
+    if rng is None:
+        rng = np.random.default_rng()
+
+    # Pick voters who don’t have winner at top
+    positions = profile.R[:, original_winner].copy()
+    eligible = np.flatnonzero(positions > 0)
+    if eligible.size == 0:
+        return 0.0
 
-    n = len(ballots)
     violations = 0
-    for _ in range(trials):
-        b_copy = deepcopy(ballots)
-        # Pick voter who doesn’t have winner at top
-        idxs = [i for i, b in enumerate(b_copy) if b.index(original_winner) > 0]
-        if not idxs:
-            break
-        i = random.choice(idxs)
-        pos = b_copy[i].index(original_winner)
-        # Move up one spot
-        b_copy[i][pos], b_copy[i][pos - 1] = b_copy[i][pos - 1], b_copy[i][pos]
-        new_winner = system_func(b_copy)
+    for i in rng.choice(eligible, size=trials):
+        pos = positions[i]
+        # Move up one spot, evaluate, then swap back
+        profile.swap(i, pos)
+        try:
+            new_winner = system_func(profile)
+        finally:
+            profile.swap(i, pos)
         if new_winner != original_winner:
             violations += 1
     return violations / max(1, trials)
@@ -1,9 +1,31 @@
-import random
-
-def generate_election(num_voters=100, num_candidates=4):
-    candidates = [f"C{i}" for i in range(1, num_candidates + 1)]
-    ballots = []
-    for _ in range(num_voters):
-        ballot = random.sample(candidates, len(candidates)) 
-        ballots.append(ballot)
-    return ballots
\ No newline at end of file
+# election/generate.py
+"""
+Random election generation.
+
+Ballot contract used throughout the package: an election is a C-contiguous
+int8 ndarray of shape (num_voters, num_candidates) where ballots[v, r] is the
+id (0..m-1) of the candidate voter v ranks r-th, so every row is a permutation
+of range(m). A batch of elections adds a leading trial axis, (T, n, m).
+Candidates are only turned into names for display, via candidate_names.
+"""
+import numpy as np
+
+def _random_rankings(shape, rng=None):
+    """Return an int8 array of `shape` whose last axis holds independent random rankings."""
+    if rng is None:
+        rng = np.random.default_rng()
+    base = np.arange(shape[-1], dtype=np.int8)
+    ballots = np.broadcast_to(base, shape).copy()
+    rng.permuted(ballots, axis=-1, out=ballots)
+    return ballots
+
+def generate_election(num_voters=100, num_candidates=4, rng=None):
+    return _random_rankings((num_voters, num_candidates), rng)
+
+def generate_elections(num_trials, num_voters=100, num_candidates=4, rng=None):
+    """Generate `num_trials` independent elections at once as a (T, n, m) tensor."""
+    return _random_rankings((num_trials, num_voters, num_candidates), rng)
+
+def candidate_names(num_candidates):
+    """Return display names indexed by candidate id: names[c] == f"C{c + 1}"."""
+    return np.array([f"C{c}" for c in range(1, num_candidates + 1)])
@@ -0,0 +1,113 @@
+# election/kernels.py
+"""
+Numba-compiled inner loops that operate directly on the int8 ballot matrix.
+
+The ballot kernels are specialized per candidate count: KERNELS[m] compiles
+them with m baked in as a constant, so the loops over ranks and candidates
+have fixed trip counts that LLVM can unroll and vectorize. KERNELS[4], the
+default shape everywhere, is compiled at import time.
+"""
+from collections import namedtuple
+
+import numpy as np
+from numba import njit, prange, int8, int32, int64  # JIT compiler (pip install numba)
+
+BallotKernels = namedtuple(
+    "BallotKernels", ["scores", "irv", "ranks_pairwise", "batch_ranks_pairwise"]
+)
+
+def _specialize(num_candidates):
+    """Compile the ballot kernels for exactly `num_candidates` candidates."""
+    m = num_candidates  # closure constant: frozen into each kernel at compile time
+
+    # -------------------------
+    # Positional scoring (Borda, evolved rules)
+    # -------------------------
+    @njit(int64[::1](int8[:, ::1], int32[::1]), cache=True)
+    def scores(ballots, weights):
+        """Return scores[c] = sum over ballots of weights[rank of c]."""
+        out = np.zeros(m, np.int64)
+        for v in range(ballots.shape[0]):
+            for r in range(m):
+                out[ballots[v, r]] += weights[r]
+        return out
+
+    # -------------------------
+    # Instant Runoff Voting
+    # -------------------------
+    @njit(int64(int8[:, ::1]), cache=True)
+    def irv(ballots):
+        """
+        Return the IRV winner id. Eliminated candidates are cleared in `alive`;
+        each voter's `head` cursor advances past them, so ballots are never rebuilt.
+        """
+        num_voters = ballots.shape[0]
+        alive = np.ones(m, np.bool_)
+        head = np.zeros(num_voters, np.int64)
+        remaining = m
+        while True:
+            tally = np.zeros(m, np.int64)
+            for v in range(num_voters):
+                while not alive[ballots[v, head[v]]]:
+                    head[v] += 1
+                tally[ballots[v, head[v]]] += 1
+            total = tally.sum()
+            # If one candidate has > 50% votes, they win
+            for c in range(m):
+                if alive[c] and tally[c] * 2 > total:
+                    return c
+            # Eliminate candidate with fewest votes
+            worst = -1
+            worst_votes = total + 1
+            for c in range(m):
+                if alive[c] and tally[c] < worst_votes:
+                    worst_votes = tally[c]
+                    worst = c
+            alive[worst] = False
+            remaining -= 1
+            if remaining == 1:
+                for c in range(m):
+                    if alive[c]:
+                        return c  # last one remaining
+        return -1
+
+    # -------------------------
+    # Ranks + pairwise
+    # -------------------------
+    @njit((int8[:, ::1], int8[:, ::1], int32[:, ::1]), cache=True)
+    def ranks_pairwise(ballots, ranks, pairwise):
+        """
+        Fill ranks (n, m) and pairwise (m, m) from (n, m) ballots in one fused pass.
+        `pairwise` must start zeroed.
+        """
+        for v in range(ballots.shape[0]):
+            for r in range(m):
+                above = ballots[v, r]
+                ranks[v, above] = r
+                for s in range(r + 1, m):
+                    pairwise[above, ballots[v, s]] += 1
+
+    # compiled on first call: only the GA's batches use it. The loop is repeated
+    # rather than calling ranks_pairwise, so the closure captures only m and the
+    # on-disk cache can index it.
+    @njit(parallel=True, cache=True)
+    def batch_ranks_pairwise(ballots, ranks, pairwise):
+        """Same as ranks_pairwise for a (T, n, m) batch, parallel over trials."""
+        for t in prange(ballots.shape[0]):
+            for v in range(ballots.shape[1]):
+                for r in range(m):
+                    above = ballots[t, v, r]
+                    ranks[t, v, above] = r
+                    for s in range(r + 1, m):
+                        pairwise[t, above, ballots[t, v, s]] += 1
+
+    return BallotKernels(scores, irv, ranks_pairwise, batch_ranks_pairwise)
+
+class _KernelCache(dict):
+    """KERNELS[m] -> BallotKernels for m candidates, compiled on first use."""
+    def __missing__(self, num_candidates):
+        kernels = self[num_candidates] = _specialize(num_candidates)
+        return kernels
+
+KERNELS = _KernelCache()
+KERNELS[4]  # default shape for data_collector and evolve
@@ -0,0 +1,71 @@
+# election/profile.py
+"""
+A ballot profile together with the arrays the systems and fairness metrics
+read from it, built once per election instead of once per call.
+"""
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+
+from election.fairness import condorcet_winners
+from election.kernels import KERNELS
+
+
+@dataclass
+class Profile:
+    """
+    B: (n, m) int8 ballots, B[v, r] = candidate voter v ranks r-th
+    R: (n, m) ranks, R[v, c] = position of candidate c on ballot v
+    M: (m, m) int32 head-to-head wins, M[a, b] = # voters preferring a over b
+    The arrays may carry a leading trial axis (a batch of elections);
+    index the profile to get a single election.
+    """
+    B: np.ndarray
+    R: np.ndarray
+    M: np.ndarray
+
+    @classmethod
+    def from_ballots(cls, ballots):
+        ballots = np.ascontiguousarray(ballots, dtype=np.int8)  # the kernels' signature
+        num_candidates = ballots.shape[-1]
+        kernels = KERNELS[num_candidates]
+        # one fused kernel pass fills both arrays
+        ranks = np.empty_like(ballots)
+        pairwise = np.zeros(ballots.shape[:-2] + (num_candidates, num_candidates), dtype=np.int32)
+        if ballots.ndim == 3:
+            kernels.batch_ranks_pairwise(ballots, ranks, pairwise)
+        else:
+            kernels.ranks_pairwise(ballots, ranks, pairwise)
+        return cls(ballots, ranks, pairwise)
+
+    @property
+    def n(self):
+        return self.B.shape[-2]
+
+    @property
+    def m(self):
+        return self.B.shape[-1]
+
+    @cached_property
+    def condorcet(self):
+        """Condorcet winner id (one per trial for a batch), -1 where none exists."""
+        return condorcet_winners(self.M)
+
+    def __getitem__(self, trial):
+        return Profile(self.B[trial], self.R[trial], self.M[trial])
+
+    def copy(self):
+        return Profile(self.B.copy(), self.R.copy(), self.M.copy())
+
+    def swap(self, voter, pos):
+        """
+        Swap the candidates at ranks pos-1 and pos on one ballot, updating R and M
+        to match. Swapping the same position again restores the profile.
+        """
+        above, below = self.B[voter, pos - 1], self.B[voter, pos]
+        self.B[voter, pos - 1], self.B[voter, pos] = below, above
+        self.R[voter, above], self.R[voter, below] = pos, pos - 1
+        self.M[above, below] -= 1
+        self.M[below, above] += 1
+        self.__dict__.pop("condorcet", None)
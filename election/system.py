@@ -1,94 +1,49 @@
-from election.utils import count_first_choices, remove_candidate
-from collections import defaultdict
+import numpy as np
+
+from election.utils import count_first_choices, positional_scores
+from election.kernels import KERNELS
 
 # --- Plurality ---
-def plurality_winner(ballots):
-    tally = count_first_choices(ballots)
-    return max(tally, key=tally.get)
+def plurality_winner(profile):
+    tally = count_first_choices(profile.B)
+    return int(tally.argmax())
 
 # --- Borda Count ---
-def borda_winner(ballots):
-    scores = defaultdict(int)
-    num_candidates = len(ballots[0])
-    for ballot in ballots:
-        for rank, candidate in enumerate(ballot):
-            scores[candidate] += (num_candidates - rank - 1)
-    return max(scores, key=scores.get)
+def borda_winner(profile):
+    weights = np.arange(profile.m - 1, -1, -1, dtype=np.int32)
+    return int(positional_scores(profile.B, weights).argmax())
 
 # --- Instant Runoff Voting (IRV) ---
-def irv_winner(ballots):
-    ballots_copy = ballots.copy()
-    while True:
-        tally = count_first_choices(ballots_copy)
-        # If one candidate has > 50% votes, they win
-        total_votes = sum(tally.values())
-        for candidate, votes in tally.items():
-            if votes > total_votes / 2:
-                return candidate
-        # Eliminate candidate with fewest votes
-        lowest = min(tally, key=tally.get)
-        ballots_copy = remove_candidate(ballots_copy, lowest)
-        if len(ballots_copy[0]) == 1:
-            return ballots_copy[0][0]  # last one remaining
+def irv_winner(profile):
+    return int(KERNELS[profile.m].irv(profile.B))
 
 # --- Ranked Pairs (Tideman) ---
-from collections import defaultdict
 
-def ranked_pairs_winner(ballots):
+def ranked_pairs_winner(profile):
     """
     Implements the Ranked Pairs (Tideman) voting method.
     It constructs pairwise victories and locks them to avoid cycles.
     """
-    if not ballots:
+    if profile.n == 0:
         return None
-    candidates = list(ballots[0])
+    num_candidates = profile.m
 
     # Pairwise preferences
-    pairwise = { (a,b): 0 for a in candidates for b in candidates if a != b }
-    for ballot in ballots:
-        for i_idx, i in enumerate(ballot):
-            for j in ballot[i_idx+1:]:
-                pairwise[(i,j)] += 1
-
-    # Sort pairs by strength of victory
-    pairs = []
-    for a in candidates:
-        for b in candidates:
-            if a == b:
-                continue
-            a_over_b = pairwise.get((a,b), 0)
-            b_over_a = pairwise.get((b,a), 0)
-            if a_over_b > b_over_a:
-                margin = a_over_b - b_over_a
-                pairs.append((a, b, margin))
-    pairs.sort(key=lambda x: -x[2])  # strongest victories first
+    margins = profile.M - profile.M.T
 
-    # Lock pairs avoiding cycles
-    locked = {c: set() for c in candidates}
+    # Sort pairs by strength of victory (strongest victories first)
+    pairs = np.argwhere(margins > 0)
+    order = np.argsort(-margins[pairs[:, 0], pairs[:, 1]], kind="stable")
 
-    def creates_cycle(start, end, graph):
-        """Detect if adding a link start->end would create a cycle."""
-        stack = [end]
-        visited = set()
-        while stack:
-            node = stack.pop()
-            if node == start:
-                return True
-            visited.add(node)
-            for nxt in graph[node]:
-                if nxt not in visited:
-                    stack.append(nxt)
-        return False
-
-    for winner, loser, margin in pairs:
-        if not creates_cycle(winner, loser, locked):
-            locked[winner].add(loser)
+    # Lock pairs avoiding cycles; reach[a, b] is True when b is reachable from a
+    locked = np.zeros((num_candidates, num_candidates), dtype=bool)
+    reach = np.eye(num_candidates, dtype=bool)
+    for winner, loser in pairs[order]:
+        if reach[loser, winner]:
+            continue  # locking winner->loser would close a cycle
+        locked[winner, loser] = True
+        reach |= reach[:, winner, None] & reach[loser, None, :]
 
     # Candidate with no incoming edges is the winner
-    incoming = {c: 0 for c in candidates}
-    for a in locked:
-        for b in locked[a]:
-            incoming[b] += 1
-
-    zero_in = [c for c,v in incoming.items() if v == 0]
-    return zero_in[0] if zero_in else None
+    zero_in = np.flatnonzero(~locked.any(axis=0))
+    return int(zero_in[0]) if zero_in.size else None
@@ -1,13 +1,24 @@
-from collections import Counter
+import numpy as np
+
+from election.kernels import KERNELS
 
 def count_first_choices(ballots):
-    """Return a Counter of first-choice votes for each candidate."""
-    first_choices = [ballot[0] for ballot in ballots]
-    return Counter(first_choices)
-
-def remove_candidate(ballots, candidate):
-    """Remove a candidate from all ballots."""
-    new_ballots = []
-    for ballot in ballots:
-        new_ballots.append([c for c in ballot if c != candidate])
-    return new_ballots
\ No newline at end of file
+    """Return first-choice vote counts indexed by candidate id."""
+    return np.bincount(ballots[:, 0], minlength=ballots.shape[1])
+
+def rank_weights(weights, num_candidates):
+    """Return `weights` as an int32 vector of length num_candidates (missing ranks score 0)."""
+    w = np.zeros(num_candidates, dtype=np.int32)
+    w_in = np.asarray(weights, dtype=np.int32)[:num_candidates]
+    w[:len(w_in)] = w_in
+    return w
+
+def positional_scores(ballots, weights):
+    """
+    Return the total score of each candidate id under a positional rule:
+    weights[r] points for every ballot ranking the candidate r-th
+    (ranks beyond len(weights) score 0).
+    """
+    ballots = np.ascontiguousarray(ballots, dtype=np.int8)
+    num_candidates = ballots.shape[1]
+    return KERNELS[num_candidates].scores(ballots, rank_weights(weights, num_candidates))
@@ -1,27 +1,136 @@
-# election/tests/demo_test.py
+# tests/demo_test.py
 
 import sys, os
 # optional fallback: add project root to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from ..generate import generate_election
-from ..system import plurality_winner, borda_winner, irv_winner
-from ..fairness import find_condorcet_winner, satisfaction_score
+import numpy as np
+
+from election.generate import generate_election, generate_elections
+from election.system import plurality_winner, borda_winner, irv_winner, ranked_pairs_winner
+from election.fairness import find_condorcet_winner, satisfaction_score
+from election.profile import Profile
+from election.utils import positional_scores
+
+A, B, C = 0, 1, 2
 
 def test_small_ballots():
-    ballots = [
-        ['A', 'B', 'C'],
-        ['A', 'C', 'B'],
-        ['B', 'A', 'C'],
-        ['C', 'A', 'B'],
-        ['C', 'B', 'A']
-    ]
-    print("Ballots:", ballots)
-    print("Plurality:", plurality_winner(ballots))
-    print("Borda:", borda_winner(ballots))
-    print("IRV:", irv_winner(ballots))
-    print("Condorcet:", find_condorcet_winner(ballots))
-    print("Satisfaction (Borda):", satisfaction_score(borda_winner, ballots))
+    profile = Profile.from_ballots(np.array([
+        [A, B, C],
+        [A, C, B],
+        [B, A, C],
+        [C, A, B],
+        [C, B, A]
+    ], dtype=np.int8))
+    print("Ballots:", profile.B)
+    print("Plurality:", plurality_winner(profile))
+    print("Borda:", borda_winner(profile))
+    print("IRV:", irv_winner(profile))
+    print("Condorcet:", find_condorcet_winner(profile))
+    print("Satisfaction (Borda):", satisfaction_score(borda_winner(profile), profile))
+
+    assert plurality_winner(profile) == A
+    assert borda_winner(profile) == A
+    assert irv_winner(profile) == A
+    assert find_condorcet_winner(profile) == A
+    assert satisfaction_score(borda_winner(profile), profile) == 0.6
+
+def test_ranked_pairs_skips_cycle_closing_pair():
+    # A>B 6-3, B>C 7-2, C>A 5-4: no Condorcet winner, and locking C>A would close a cycle
+    profile = Profile.from_ballots(np.array(
+        [[A, B, C]] * 4 + [[B, C, A]] * 3 + [[C, A, B]] * 2, dtype=np.int8
+    ))
+    assert find_condorcet_winner(profile) is None
+    assert ranked_pairs_winner(profile) == A
+
+def _reference_ranked_pairs(ballots):
+    # the dict-of-sets lock graph with a DFS cycle check, as before the reachability matrix
+    candidates = range(len(ballots[0]))
+    wins = {(a, b): 0 for a in candidates for b in candidates}
+    for ballot in ballots:
+        for i, a in enumerate(ballot):
+            for b in ballot[i + 1:]:
+                wins[a, b] += 1
+    pairs = [(a, b) for a in candidates for b in candidates if wins[a, b] > wins[b, a]]
+    pairs.sort(key=lambda p: wins[p[1], p[0]] - wins[p])
+    locked = {c: set() for c in candidates}
+    for winner, loser in pairs:
+        stack, seen = [loser], set()
+        while stack and winner not in seen:
+            node = stack.pop()
+            seen.add(node)
+            stack.extend(locked[node] - seen)
+        if winner not in seen:
+            locked[winner].add(loser)
+    losers = set().union(*locked.values())
+    return next(c for c in candidates if c not in losers)
+
+def test_ranked_pairs_matches_reference_lock_in():
+    rng = np.random.default_rng(5)
+    for _ in range(300):
+        ballots = generate_election(int(rng.integers(1, 40)), int(rng.integers(2, 7)), rng)
+        assert ranked_pairs_winner(Profile.from_ballots(ballots)) == _reference_ranked_pairs(ballots.tolist())
+
+def _reference_irv(ballots):
+    remaining = list(range(len(ballots[0])))
+    while len(remaining) > 1:
+        tally = {c: 0 for c in remaining}
+        for ballot in ballots:
+            tally[next(c for c in ballot if c in tally)] += 1
+        leader = max(remaining, key=tally.get)
+        if tally[leader] * 2 > len(ballots):
+            return leader
+        remaining.remove(min(remaining, key=tally.get))  # ties: lowest id goes first
+    return remaining[0]
+
+def test_irv_matches_reference_count():
+    rng = np.random.default_rng(4)
+    for _ in range(300):
+        ballots = generate_election(int(rng.integers(1, 40)), int(rng.integers(2, 7)), rng)
+        assert irv_winner(Profile.from_ballots(ballots)) == _reference_irv(ballots.tolist())
+
+def test_from_ballots_accepts_any_int_dtype():
+    ballots = np.array([[A, B, C], [B, A, C], [A, C, B]])  # platform int, not int8
+    profile = Profile.from_ballots(ballots)
+    assert profile.B.dtype == np.int8
+    assert borda_winner(profile) == A
+    assert positional_scores(ballots, [2, 1]).tolist() == [5, 3, 1]
+
+def test_generated_ballots_are_permutations():
+    ballots = generate_election(50, 5, np.random.default_rng(0))
+    assert ballots.shape == (50, 5)
+    assert ballots.dtype == np.int8
+    assert (np.sort(ballots, axis=1) == np.arange(5)).all()
+
+def test_swap_keeps_profile_in_sync():
+    profile = Profile.from_ballots(generate_election(20, 4, np.random.default_rng(1)))
+    original = Profile.from_ballots(profile.B.copy())
+    profile.condorcet  # populate the cache; swap must invalidate it
+    profile.swap(3, 2)
+    rebuilt = Profile.from_ballots(profile.B.copy())
+    assert (profile.R == rebuilt.R).all() and (profile.M == rebuilt.M).all()
+    assert profile.condorcet == rebuilt.condorcet
+    profile.swap(3, 2)
+    assert (profile.B == original.B).all() and (profile.M == original.M).all()
+
+def test_batched_profile_matches_per_trial_profiles():
+    batch = Profile.from_ballots(generate_elections(6, 25, 5, np.random.default_rng(3)))
+    for t in range(6):
+        single = Profile.from_ballots(batch.B[t].copy())
+        assert (batch.R[t] == single.R).all() and (batch.M[t] == single.M).all()
+
+def test_profile_counts_head_to_heads():
+    rng = np.random.default_rng(2)
+    for num_candidates in (4, 9):
+        ballots = generate_election(30, num_candidates, rng)
+        expected = np.zeros((num_candidates, num_candidates), dtype=int)
+        for ballot in ballots.tolist():
+            for i, a in enumerate(ballot):
+                for b in ballot[i + 1:]:
+                    expected[a, b] += 1
+        profile = Profile.from_ballots(ballots)
+        assert (profile.M == expected).all()
+        assert (np.take_along_axis(profile.R, ballots.astype(np.intp), axis=1) == np.arange(num_candidates)).all()
 
 if __name__ == "__main__":
     test_small_ballots()